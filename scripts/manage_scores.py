@@ -4,13 +4,20 @@
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
+import os
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
 from datetime import datetime, timezone
-import secrets
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; the stdlib fallback is kept in sync below
+    orjson = None
 
 ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT / "data"
@@ -21,39 +28,59 @@ EVENTS_PATH = DATA_DIR / "events.json"
 GUEST_TOKENS_PATH = DATA_DIR / "guest_tokens.json"
 PLAYS_PATH = DATA_DIR / "plays.json"
 LEADERBOARD_PATH = PUBLIC_DIR / "leaderboard.json"
+UNRANKED_LEADERBOARD_PATH = PUBLIC_DIR / "leaderboard-unranked.json"
+LEADERBOARD_STAMP_PATH = DATA_DIR / ".leaderboard.stamp"
 PUBLIC_GUEST_TOKENS_PATH = PUBLIC_DIR / "guest_tokens.json"
 
-ISO_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+# from 3.11 fromisoformat also accepts "Z" and the other ISO 8601 shapes strptime used to cover
+NATIVE_ISO_PARSING = sys.version_info >= (3, 11)
+# podium labels indexed by placement (1-3)
+ORDINALS = ("", "1st", "2nd", "3rd")
+EARLIEST_TIMESTAMP = datetime.min.replace(tzinfo=timezone.utc)
 
 
 def load_json(path: Path, default: Any) -> Any:
-    if not path.exists():
+    try:
+        content = path.read_bytes()
+    except FileNotFoundError:
         return default
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
 
 
-def save_json(path: Path, data: Any) -> None:
+def save_json(path: Path, data: Any, only_if_changed: bool = False) -> bool:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(data, handle, indent=2)
-        handle.write("\n")
+    if orjson is not None:
+        content = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    else:
+        # ensure_ascii=False matches orjson's output so files don't churn between environments
+        content = (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+    if only_if_changed and path.exists() and path.read_bytes() == content:
+        return False
+    # write a sibling file and swap it in so the site never reads a half-written feed;
+    # the pid keeps two concurrent runs from sharing a temp file
+    tmp_path = path.with_suffix(path.suffix + f".tmp.{os.getpid()}")
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
+    return True
 
 
 def parse_timestamp(value: Optional[str], fallback: Optional[str] = None) -> Optional[datetime]:
     raw = value or fallback
     if not raw:
         return None
+    return _parse_timestamp_cached(raw)
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp_cached(raw: str) -> Optional[datetime]:
+    if not NATIVE_ISO_PARSING and raw[-1] == "Z":
+        raw = raw[:-1] + "+00:00"
     try:
-        if raw.endswith("Z"):
-            dt = datetime.fromisoformat(raw.replace("Z", "+00:00"))
-        else:
-            dt = datetime.fromisoformat(raw)
+        dt = datetime.fromisoformat(raw)
     except ValueError:
-        try:
-            dt = datetime.strptime(raw, ISO_FORMAT)
-        except ValueError:
-            return None
+        return None
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
     return dt
@@ -86,7 +113,10 @@ def save_guest_tokens(payload: Dict[str, Any]) -> None:
 
 
 def load_plays_payload() -> Dict[str, Any]:
-    payload = load_json(PLAYS_PATH, {"plays": []})
+    return normalize_plays_payload(load_json(PLAYS_PATH, {"plays": []}))
+
+
+def normalize_plays_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
     plays = payload.get("plays")
     if not isinstance(plays, list):
         plays = []
@@ -94,7 +124,7 @@ def load_plays_payload() -> Dict[str, Any]:
     for entry in plays:
         if not isinstance(entry, dict):
             continue
-        game = str(entry.get("game", "")).strip()
+        game = sys.intern(str(entry.get("game", "")).strip())
         results = entry.get("results")
         date = entry.get("date")
         event = entry.get("event")
@@ -106,7 +136,7 @@ def load_plays_payload() -> Dict[str, Any]:
             for res in results:
                 if not isinstance(res, dict):
                     continue
-                player = str(res.get("player", "")).strip()
+                player = sys.intern(str(res.get("player", "")).strip())
                 if not player:
                     continue
                 placement = res.get("placement")
@@ -177,16 +207,25 @@ def parse_name_arguments(values: Optional[List[str]]) -> List[str]:
     return names
 
 
+def name_list_argument(value: str) -> List[str]:
+    return parse_name_arguments([value])
+
+
 def dedupe_preserve_case(names: List[str]) -> List[str]:
-    seen = set()
-    result: List[str] = []
+    # casefolded key -> first spelling seen; dicts keep insertion order
+    seen: Dict[str, str] = {}
     for name in names:
         key = name.casefold()
-        if key in seen:
-            continue
-        seen.add(key)
-        result.append(name)
-    return result
+        if key not in seen:
+            seen[key] = name
+    return list(seen.values())
+
+
+def sorted_by_count(counts: Dict[str, int]) -> List[Tuple[str, int]]:
+    # two stable sorts (name, then count) give the (-count, name.lower()) order without tuple keys
+    ordered = sorted(counts.items(), key=lambda item: item[0].lower())
+    ordered.sort(key=lambda item: item[1], reverse=True)
+    return ordered
 
 
 def compute_unranked_summary(
@@ -209,19 +248,15 @@ def compute_unranked_summary(
             "player": player_name,
             "plays": 0,
             "points": 0,
-            "games": defaultdict(int),
-            "awards": defaultdict(int),
+            "games": Counter(),
+            "awards": Counter(),
         }
         player_stats[player_name] = entry
         return entry
 
     def format_reason(placement: Optional[int]) -> str:
-        if placement == 1:
-            return "1st place"
-        if placement == 2:
-            return "2nd place"
-        if placement == 3:
-            return "3rd place"
+        if placement in (1, 2, 3):
+            return f"{ORDINALS[placement]} place"
         return "Participated"
 
     for play in unranked_plays:
@@ -231,12 +266,14 @@ def compute_unranked_summary(
         timestamp = parse_timestamp(play.get("timestamp"), date_str)
         if timestamp:
             updated_candidates.append(timestamp)
+        sort_ts = timestamp or parse_timestamp(date_str) or EARLIEST_TIMESTAMP
 
         event_entry = {
             "name": event_name,
             "date": date_str,
             "awards": [],
             "timestamp": timestamp.isoformat() if timestamp else None,
+            "_ts": sort_ts,
         }
 
         for result in play.get("results", []):
@@ -244,15 +281,16 @@ def compute_unranked_summary(
             if not player_name:
                 continue
 
+            points_value = int(result.get("points", 0))
             stats = ensure_stats(player_name)
             stats["plays"] += 1
-            stats["points"] += int(result.get("points", 0))
+            stats["points"] += points_value
             stats["games"][game] += 1
 
             event_entry["awards"].append(
                 {
                     "player": player_name,
-                    "points": int(result.get("points", 0)),
+                    "points": points_value,
                     "reason": format_reason(result.get("placement")),
                     "timestamp": timestamp.isoformat() if timestamp else None,
                     "ranked": False,
@@ -271,6 +309,7 @@ def compute_unranked_summary(
             "notes": play.get("notes"),
             "timestamp": event_entry["timestamp"],
             "results": play.get("results", []),
+            "_ts": sort_ts,
         }
         recent_plays.append(play_entry)
 
@@ -279,19 +318,18 @@ def compute_unranked_summary(
         if not unranked_awards:
             continue
 
-        timestamp = None
-        if unranked_awards:
-            timestamps = [parse_timestamp(award.get("timestamp")) for award in unranked_awards]
-            timestamps = [ts for ts in timestamps if ts]
-            if timestamps:
-                timestamp = max(timestamps)
-                updated_candidates.append(timestamp)
+        parsed_times = (parse_timestamp(award.get("timestamp")) for award in unranked_awards)
+        timestamp = max((ts for ts in parsed_times if ts), default=None)
+        if timestamp:
+            updated_candidates.append(timestamp)
+        event_time = parse_timestamp(event.get("date"))
 
         event_entry = {
             "name": event.get("name") or "Unranked awards",
             "date": event.get("date"),
             "awards": [],
             "timestamp": timestamp.isoformat() if timestamp else None,
+            "_ts": timestamp or event_time or EARLIEST_TIMESTAMP,
         }
 
         for award in unranked_awards:
@@ -300,53 +338,48 @@ def compute_unranked_summary(
                 continue
             stats = ensure_stats(player_name)
             points_value = int(award.get("points", 0))
+            reason = award.get("reason") or "Awarded points"
             stats["points"] += points_value
-            stats["awards"][award.get("reason") or "Awarded points"] += 1
+            stats["awards"][reason] += 1
 
             event_entry["awards"].append(
                 {
                     "player": player_name,
                     "points": points_value,
-                    "reason": award.get("reason") or "Awarded points",
+                    "reason": reason,
                     "timestamp": award.get("timestamp"),
                     "ranked": False,
+                    "_ts": parse_timestamp(award.get("timestamp")) or event_time or EARLIEST_TIMESTAMP,
                 }
             )
 
         if event_entry["awards"]:
             # sort newest first within event
-            event_entry["awards"].sort(
-                key=lambda award: parse_timestamp(award.get("timestamp"))
-                or parse_timestamp(event_entry.get("date"))
-                or datetime.min.replace(tzinfo=timezone.utc),
-                reverse=True,
-            )
+            event_entry["awards"].sort(key=lambda award: award["_ts"], reverse=True)
+            for award_entry in event_entry["awards"]:
+                del award_entry["_ts"]
             recent_events.append(event_entry)
 
-    def latest_timestamp(entry_timestamp: Optional[str], fallback_date: Optional[str]) -> datetime:
-        return parse_timestamp(entry_timestamp, fallback_date) or datetime.min.replace(tzinfo=timezone.utc)
-
-    recent_events.sort(key=lambda ev: latest_timestamp(ev.get("timestamp"), ev.get("date")), reverse=True)
+    recent_events.sort(key=lambda ev: ev["_ts"], reverse=True)
+    for event_entry in recent_events:
+        del event_entry["_ts"]
     all_events = list(recent_events)
 
     limit = config.get("recentEventsLimit", 5)
     if isinstance(limit, int) and limit > 0:
         recent_events = recent_events[:limit]
 
-    recent_plays.sort(key=lambda play: latest_timestamp(play.get("timestamp"), play.get("date")), reverse=True)
+    recent_plays.sort(key=lambda play: play["_ts"], reverse=True)
+    for play_entry in recent_plays:
+        del play_entry["_ts"]
     all_plays = list(recent_plays)
-    plays_limit = config.get("recentEventsLimit", 5)
-    if isinstance(plays_limit, int) and plays_limit > 0:
-        recent_plays = recent_plays[:plays_limit]
+    if isinstance(limit, int) and limit > 0:
+        recent_plays = recent_plays[:limit]
 
     players_list = []
     for stats in player_stats.values():
-        games_breakdown = sorted(
-            stats["games"].items(), key=lambda item: (-item[1], item[0].lower())
-        )
-        awards_breakdown = sorted(
-            stats["awards"].items(), key=lambda item: (-item[1], item[0].lower())
-        )
+        games_breakdown = sorted_by_count(stats["games"])
+        awards_breakdown = sorted_by_count(stats["awards"])
         total_score = stats["points"] + stats["plays"]
         breakdown = []
         for game_name, count in games_breakdown:
@@ -384,9 +417,7 @@ def compute_unranked_summary(
 
     activity_list = []
     for stats in player_stats.values():
-        games_breakdown = sorted(
-            stats["games"].items(), key=lambda item: (-item[1], item[0].lower())
-        )
+        games_breakdown = sorted_by_count(stats["games"])
         activity_list.append(
             {
                 "player": stats["player"],
@@ -440,6 +471,7 @@ def compute_ranked_summary(
     recent_plays: List[Dict[str, Any]] = []
     updated_candidates: List[datetime] = []
     player_activity: Dict[str, Dict[str, Any]] = {}
+    limit = config.get("recentEventsLimit", 10)
 
     def ensure_activity(player_name: str) -> Dict[str, Any]:
         entry = player_activity.get(player_name)
@@ -450,7 +482,7 @@ def compute_ranked_summary(
             "totalPlays": 0,
             "scoredPlays": 0,
             "unscoredPlays": 0,
-            "games": defaultdict(int),
+            "games": Counter(),
             "podiums": defaultdict(int),
         }
         player_activity[player_name] = entry
@@ -460,7 +492,10 @@ def compute_ranked_summary(
         name = event.get("name") or "Game Night"
         date_str = event.get("date")
         awards = event.get("awards") or []
-        event_entry = {"name": name, "date": date_str, "awards": []}
+        event_awards: List[Dict[str, Any]] = []
+        event_entry = {"name": name, "date": date_str, "awards": event_awards}
+        event_time = parse_timestamp(date_str)
+        latest = event_time
 
         for award in awards:
             player_name = award.get("player")
@@ -472,37 +507,44 @@ def compute_ranked_summary(
                 points = int(award.get("points", 0))
             except (TypeError, ValueError):
                 points = 0
-            reason = award.get("reason") or "Awarded points"
+            # names and reasons repeat across most awards; interned keys hash and compare by identity
+            player_name = sys.intern(player_name)
+            reason = sys.intern(award.get("reason") or "Awarded points")
             timestamp = parse_timestamp(award.get("timestamp"), date_str)
             if timestamp:
                 updated_candidates.append(timestamp)
+                if latest is None or timestamp > latest:
+                    latest = timestamp
 
-            player = players.setdefault(
-                player_name,
-                {"player": player_name, "points": 0, "breakdown": defaultdict(lambda: {"count": 0, "points": 0})},
-            )
+            player = players.get(player_name)
+            if player is None:
+                player = {"player": player_name, "points": 0, "breakdown": {}}
+                players[player_name] = player
 
             player["points"] += points
-            bucket = player["breakdown"][reason]
+            breakdown = player["breakdown"]
+            bucket = breakdown.get(reason)
+            if bucket is None:
+                bucket = {"count": 0, "points": 0}
+                breakdown[reason] = bucket
             bucket["count"] += 1
             bucket["points"] += points
 
-            event_entry["awards"].append(
+            event_awards.append(
                 {
                     "player": player_name,
                     "points": points,
                     "reason": reason,
                     "timestamp": timestamp.isoformat() if timestamp else None,
+                    "_ts": timestamp or event_time or EARLIEST_TIMESTAMP,
                 }
             )
 
-        if event_entry["awards"]:
-            event_entry["awards"].sort(
-                key=lambda award: parse_timestamp(award.get("timestamp"))
-                or parse_timestamp(event.get("date"))
-                or datetime.min.replace(tzinfo=timezone.utc),
-                reverse=True,
-            )
+        if event_awards:
+            event_awards.sort(key=lambda award: award["_ts"], reverse=True)
+            for award_entry in event_awards:
+                del award_entry["_ts"]
+            event_entry["_ts"] = latest or EARLIEST_TIMESTAMP
             recent_events.append(event_entry)
 
     for play in ranked_plays:
@@ -524,6 +566,7 @@ def compute_ranked_summary(
             "notes": notes,
             "timestamp": timestamp.isoformat() if timestamp else None,
             "results": [],
+            "_ts": timestamp or parse_timestamp(date_str) or EARLIEST_TIMESTAMP,
         }
 
         for result in results:
@@ -589,42 +632,24 @@ def compute_ranked_summary(
             previous_points = player["points"]
         player["rank"] = current_rank
 
-    def latest_timestamp_for_event(event: Dict[str, Any]) -> datetime:
-        candidate_times = []
-        for award in event.get("awards", []):
-            candidate = parse_timestamp(award.get("timestamp"))
-            if candidate:
-                candidate_times.append(candidate)
-        event_time = parse_timestamp(event.get("date"))
-        if event_time:
-            candidate_times.append(event_time)
-        if not candidate_times:
-            return datetime.min.replace(tzinfo=timezone.utc)
-        return max(candidate_times)
-
-    recent_events.sort(key=latest_timestamp_for_event, reverse=True)
+    recent_events.sort(key=lambda event_entry: event_entry["_ts"], reverse=True)
+    for event_entry in recent_events:
+        del event_entry["_ts"]
     all_events = list(recent_events)
 
-    limit = config.get("recentEventsLimit", 10)
     if isinstance(limit, int) and limit > 0:
         recent_events = recent_events[:limit]
 
-    def latest_timestamp_for_play(play_entry: Dict[str, Any]) -> datetime:
-        candidate = parse_timestamp(play_entry.get("timestamp"), play_entry.get("date"))
-        if candidate:
-            return candidate
-        return datetime.min.replace(tzinfo=timezone.utc)
-
-    recent_plays.sort(key=latest_timestamp_for_play, reverse=True)
+    recent_plays.sort(key=lambda play_entry: play_entry["_ts"], reverse=True)
+    for play_entry in recent_plays:
+        del play_entry["_ts"]
     all_plays = list(recent_plays)
     if isinstance(limit, int) and limit > 0:
         recent_plays = recent_plays[:limit]
 
     activity_list: List[Dict[str, Any]] = []
     for stats in player_activity.values():
-        games_counts = sorted(
-            stats["games"].items(), key=lambda item: (-item[1], item[0].lower())
-        )
+        games_counts = sorted_by_count(stats["games"])
         activity_list.append(
             {
                 "player": stats["player"],
@@ -680,23 +705,92 @@ def compute_leaderboard(
     raise ValueError(f"Unsupported mode: {mode}")
 
 
-def rebuild_leaderboard(verbose: bool = False) -> Dict[str, Any]:
-    config = load_json(CONFIG_PATH, {})
-    events = load_json(EVENTS_PATH, {"events": []})
-    plays = load_plays_payload()
-    ranked_payload = compute_leaderboard(config, events, plays, mode="ranked")
-    unranked_payload = compute_leaderboard(config, events, plays, mode="unranked")
-    save_json(LEADERBOARD_PATH, ranked_payload)
-    save_json(PUBLIC_DIR / "leaderboard-unranked.json", unranked_payload)
-    guest_tokens = load_guest_tokens()
-    save_json(PUBLIC_GUEST_TOKENS_PATH, guest_tokens)
+def rebuild_leaderboard(
+    verbose: bool = False,
+    config: Optional[Dict[str, Any]] = None,
+    events: Optional[Dict[str, Any]] = None,
+    plays: Optional[Dict[str, Any]] = None,
+    guest_tokens: Optional[Dict[str, Any]] = None,
+    force: bool = False,
+) -> Dict[str, Any]:
+    # callers that just saved a payload pass it in to skip re-reading it from disk
+    if config is None:
+        config = load_json(CONFIG_PATH, {})
+    if events is None:
+        events = load_json(EVENTS_PATH, {"events": []})
+    if plays is None:
+        plays = load_plays_payload()
+
+    stamp = leaderboard_stamp(config, events, plays)
+    # force (the `rebuild` command) always recomputes, so it can repair hand-edited feeds
+    reuse = (
+        not force
+        and LEADERBOARD_PATH.exists()
+        and UNRANKED_LEADERBOARD_PATH.exists()
+        and LEADERBOARD_STAMP_PATH.exists()
+        and LEADERBOARD_STAMP_PATH.read_text(encoding="utf-8").strip() == stamp
+    )
+    if reuse:
+        # e.g. token-only changes: the published feeds already match these inputs
+        try:
+            ranked_payload = load_json(LEADERBOARD_PATH, {})
+            load_json(UNRANKED_LEADERBOARD_PATH, {})
+        except ValueError:
+            reuse = False  # either feed is unreadable, e.g. left with merge conflict markers
+        else:
+            os.utime(LEADERBOARD_PATH)  # keep the freshness check used by `list` happy
+    if not reuse:
+        ranked_payload = compute_leaderboard(config, events, plays, mode="ranked")
+        unranked_payload = compute_leaderboard(config, events, plays, mode="unranked")
+        ranked_written = save_json(LEADERBOARD_PATH, ranked_payload, only_if_changed=True)
+        if not ranked_written:
+            os.utime(LEADERBOARD_PATH)  # same content, but now known to match the inputs
+        unranked_written = save_json(UNRANKED_LEADERBOARD_PATH, unranked_payload, only_if_changed=True)
+        LEADERBOARD_STAMP_PATH.write_text(stamp + "\n", encoding="utf-8")
+    if guest_tokens is None:
+        guest_tokens = load_guest_tokens()
+    tokens_written = save_json(PUBLIC_GUEST_TOKENS_PATH, guest_tokens, only_if_changed=True)
     if verbose:
-        print(f"Wrote leaderboard to {LEADERBOARD_PATH.relative_to(ROOT)}")
-        print(f"Wrote unranked leaderboard to {(PUBLIC_DIR / 'leaderboard-unranked.json').relative_to(ROOT)}")
-        print(f"Wrote guest tokens to {PUBLIC_GUEST_TOKENS_PATH.relative_to(ROOT)}")
+        if reuse:
+            print(f"Leaderboard inputs unchanged; kept {LEADERBOARD_PATH.relative_to(ROOT)}")
+            print(f"Leaderboard inputs unchanged; kept {UNRANKED_LEADERBOARD_PATH.relative_to(ROOT)}")
+        else:
+            if ranked_written:
+                print(f"Wrote leaderboard to {LEADERBOARD_PATH.relative_to(ROOT)}")
+            else:
+                print(f"Leaderboard unchanged; kept {LEADERBOARD_PATH.relative_to(ROOT)}")
+            if unranked_written:
+                print(f"Wrote unranked leaderboard to {UNRANKED_LEADERBOARD_PATH.relative_to(ROOT)}")
+            else:
+                print(f"Unranked leaderboard unchanged; kept {UNRANKED_LEADERBOARD_PATH.relative_to(ROOT)}")
+        if tokens_written:
+            print(f"Wrote guest tokens to {PUBLIC_GUEST_TOKENS_PATH.relative_to(ROOT)}")
+        else:
+            print(f"Guest tokens unchanged; kept {PUBLIC_GUEST_TOKENS_PATH.relative_to(ROOT)}")
     return ranked_payload
 
 
+def leaderboard_stamp(config: Dict[str, Any], events: Dict[str, Any], plays: Dict[str, Any]) -> str:
+    # the script's own source is hashed too so code changes always force a recompute
+    import hashlib  # only the write paths hash; read-only commands skip the import
+
+    if orjson is not None:
+        inputs = orjson.dumps([config, events, plays], option=orjson.OPT_NON_STR_KEYS)
+    else:
+        inputs = json.dumps([config, events, plays]).encode("utf-8")
+    digest = hashlib.blake2b(inputs, digest_size=16)
+    digest.update(Path(__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def _leaderboard_is_fresh() -> bool:
+    if not LEADERBOARD_PATH.exists():
+        return False
+    inputs = [path for path in (CONFIG_PATH, EVENTS_PATH, PLAYS_PATH, Path(__file__)) if path.exists()]
+    newest_input = max((path.stat().st_mtime for path in inputs), default=0.0)
+    return newest_input <= LEADERBOARD_PATH.stat().st_mtime
+
+
 def ensure_event(events: Dict[str, Any], name: str, date: str) -> Dict[str, Any]:
     for event in events.get("events", []):
         if event.get("name") == name and event.get("date") == date:
@@ -768,27 +862,45 @@ def command_award(args: argparse.Namespace) -> int:
         }
     )
     save_json(EVENTS_PATH, events)
-    rebuild_leaderboard(verbose=args.verbose)
+    rebuild_leaderboard(verbose=args.verbose, events=events)
     status = "ranked" if ranked_flag else "unranked"
     print(f"Awarded {points} pts to {player} for '{reason}' on {date} ({status}).")
     return 0
 
 
 def command_list(args: argparse.Namespace) -> int:
-    payload = rebuild_leaderboard(verbose=False)
+    payload = None
+    if _leaderboard_is_fresh():
+        try:
+            payload = load_json(LEADERBOARD_PATH, {})
+        except ValueError:
+            pass
+    if payload is None:
+        payload = rebuild_leaderboard(verbose=False)
     rows = payload["leaderboard"]
     if not rows:
         print("No awards logged yet.")
         return 0
 
-    name_width = max(len("Player"), max((len(row["player"]) for row in rows), default=6))
-    points_width = max(len("Points"), max((len(str(row["points"])) for row in rows), default=6))
-
-    print(f"{'Rank':<6}{'Player':<{name_width}}  {'Points':>{points_width}}  Top awards")
-    print("-" * (name_width + points_width + 20))
+    name_width = len("Player")
+    points_width = len("Points")
+    points_labels: List[str] = []
     for row in rows:
+        label = str(row["points"])
+        points_labels.append(label)
+        if len(row["player"]) > name_width:
+            name_width = len(row["player"])
+        if len(label) > points_width:
+            points_width = len(label)
+
+    lines = [
+        f"{'Rank':<6}{'Player':<{name_width}}  {'Points':>{points_width}}  Top awards",
+        "-" * (name_width + points_width + 20),
+    ]
+    for row, label in zip(rows, points_labels):
         top_award = row["breakdown"][0]["reason"] if row["breakdown"] else ""
-        print(f"#{row['rank']:<5}{row['player']:<{name_width}}  {row['points']:>{points_width}}  {top_award}")
+        lines.append(f"#{row['rank']:<5}{row['player']:<{name_width}}  {label:>{points_width}}  {top_award}")
+    sys.stdout.write("\n".join(lines) + "\n")
     return 0
 
 
@@ -799,28 +911,40 @@ def command_events(args: argparse.Namespace) -> int:
         return 0
 
     events.sort(key=lambda ev: ev.get("date") or "", reverse=True)
+    lines: List[str] = []
     for event in events:
-        print(f"{event.get('date', 'Unknown date')} — {event.get('name', 'Game Night')}")
+        lines.append(f"{event.get('date', 'Unknown date')} — {event.get('name', 'Game Night')}")
         for award in event.get("awards", []):
             player = award.get("player", "Unknown")
             points = award.get("points", 0)
             reason = award.get("reason", "Awarded points")
             suffix = " (unranked)" if award.get("ranked") is False else ""
-            print(f"  +{points} pts to {player}: {reason}{suffix}")
-        print()
+            lines.append(f"  +{points} pts to {player}: {reason}{suffix}")
+        lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
     return 0
 
 
 def command_rebuild(args: argparse.Namespace) -> int:
-    rebuild_leaderboard(verbose=True)
+    rebuild_leaderboard(verbose=True, force=True)
     return 0
 
 
-def generate_unique_token(existing: Dict[str, str]) -> str:
-    while True:
-        token = secrets.token_urlsafe(5).rstrip("=")
-        if token not in existing:
-            return token
+def generate_unique_tokens(existing: Dict[str, str], count: int) -> List[str]:
+    # 5 random bytes encode exactly like secrets.token_urlsafe(5)
+    import base64
+    import secrets
+
+    tokens: List[str] = []
+    taken = set(existing)
+    while len(tokens) < count:
+        raw = secrets.token_bytes(5 * (count - len(tokens)))
+        for offset in range(0, len(raw), 5):
+            token = base64.urlsafe_b64encode(raw[offset : offset + 5]).rstrip(b"=").decode("ascii")
+            if token not in taken:
+                taken.add(token)
+                tokens.append(token)
+    return tokens
 
 
 def command_tokens_add(args: argparse.Namespace) -> int:
@@ -834,24 +958,30 @@ def command_tokens_add(args: argparse.Namespace) -> int:
     payload = load_guest_tokens()
     tokens = payload.setdefault("tokens", {})
     created: Dict[str, str] = {}
+    # name -> first token issued for it
+    by_name: Dict[str, str] = {}
+    for key, value in tokens.items():
+        by_name.setdefault(value, key)
+    new_names = [name for name in dict.fromkeys(name.strip() for name in names) if name and name not in by_name]
+    candidates = iter(generate_unique_tokens(tokens, len(new_names)))
     for name in names:
         cleaned = name.strip()
         if not cleaned:
             continue
-        if cleaned in tokens.values():
-            # avoid duplicate entries with different tokens
-            existing_token = next((key for key, value in tokens.items() if value == cleaned), None)
-            if existing_token:
-                print(f"Token already exists for {cleaned}: {existing_token}")
-                continue
-        token = generate_unique_token(tokens)
+        # avoid duplicate entries with different tokens
+        existing_token = by_name.get(cleaned)
+        if existing_token:
+            print(f"Token already exists for {cleaned}: {existing_token}")
+            continue
+        token = next(candidates)
         tokens[token] = cleaned
+        by_name[cleaned] = token
         created[cleaned] = token
     if not created:
         print("No new tokens created.")
         return 1
     save_guest_tokens(payload)
-    rebuild_leaderboard(verbose=args.verbose)
+    rebuild_leaderboard(verbose=args.verbose, guest_tokens=payload)
     for name, token in created.items():
         print(f"{name}: {token}")
     return 0
@@ -889,12 +1019,14 @@ def command_tokens_remove(args: argparse.Namespace) -> int:
             print(f"Token {token} not found.", file=sys.stderr)
     if removed_any:
         save_guest_tokens(payload)
-        rebuild_leaderboard(verbose=args.verbose)
+        rebuild_leaderboard(verbose=args.verbose, guest_tokens=payload)
         return 0
     return 1
 
 
 def command_plays_add(args: argparse.Namespace) -> int:
+    import secrets
+
     plays_payload = load_plays_payload()
     events_payload = load_json(EVENTS_PATH, {"events": []})
 
@@ -925,7 +1057,7 @@ def command_plays_add(args: argparse.Namespace) -> int:
         default_prompt = input("Count this play for points? [Y/n]: ").strip().lower()
         scored = default_prompt != "n"
 
-    participants = parse_name_arguments(args.players)
+    participants = args.players or []
     if not participants:
         participants = parse_name_arguments([input("Players (comma separated): ")])
     participants = dedupe_preserve_case(participants)
@@ -939,25 +1071,17 @@ def command_plays_add(args: argparse.Namespace) -> int:
         response = input(f"{label} place (comma separated, blank for none): ").strip()
         return dedupe_preserve_case(parse_name_arguments([response]))
 
-    first = prompt_placement("First", parse_name_arguments(args.first)) if scored else []
-    second = prompt_placement("Second", parse_name_arguments(args.second)) if scored else []
-    third = prompt_placement("Third", parse_name_arguments(args.third)) if scored else []
+    first = prompt_placement("First", args.first) if scored else []
+    second = prompt_placement("Second", args.second) if scored else []
+    third = prompt_placement("Third", args.third) if scored else []
 
     note = args.note
     if note is None:
         note_input = input("Notes (optional): ").strip()
         note = note_input or None
 
-    auto_award: Optional[bool]
-    if args.award and args.no_award:
-        print("Cannot use --award and --no-award together.", file=sys.stderr)
-        return 1
-    if args.award:
-        auto_award = True
-    elif args.no_award:
-        auto_award = False
-    else:
-        auto_award = scored
+    # --award / --no-award override the default of auto-awarding only ranked plays
+    auto_award = scored if args.award is None else args.award
 
     points_first = args.points_first if args.points_first is not None else 5
     points_second = args.points_second if args.points_second is not None else 3
@@ -993,8 +1117,7 @@ def command_plays_add(args: argparse.Namespace) -> int:
             add_result(name, placement)
 
     for participant in participants:
-        if participant.casefold() not in added:
-            add_result(participant, None)
+        add_result(participant, None)
 
     plays_list = plays_payload.setdefault("plays", [])
     plays_list.append(
@@ -1023,7 +1146,7 @@ def command_plays_add(args: argparse.Namespace) -> int:
                 if points_value <= 0:
                     continue
                 for name in names:
-                    reason = f"{placement}{'st' if placement == 1 else 'nd' if placement == 2 else 'rd'} place in {game}"
+                    reason = f"{ORDINALS[placement]} place in {game}"
                     event.setdefault("awards", []).append(
                         {
                             "player": name,
@@ -1035,7 +1158,12 @@ def command_plays_add(args: argparse.Namespace) -> int:
                     )
             save_json(EVENTS_PATH, events_payload)
 
-    rebuild_leaderboard(verbose=args.verbose)
+    # plays_payload holds the raw entry just appended; normalize it the same way a reload would
+    rebuild_leaderboard(
+        verbose=args.verbose,
+        events=events_payload,
+        plays=normalize_plays_payload(plays_payload),
+    )
 
     status = "ranked" if scored else "unranked"
     print(f"Logged {status} play of {game} on {date} with {len(participants)} participant(s).")
@@ -1052,15 +1180,17 @@ def command_plays_list(args: argparse.Namespace) -> int:
         return 0
 
     def play_timestamp(play: Dict[str, Any]) -> datetime:
-        return parse_timestamp(play.get("timestamp"), play.get("date")) or datetime.min.replace(
-            tzinfo=timezone.utc
-        )
+        return parse_timestamp(play.get("timestamp"), play.get("date")) or EARLIEST_TIMESTAMP
 
-    plays_sorted = sorted(plays, key=play_timestamp, reverse=True)
     limit = args.limit
-    if limit is not None:
-        plays_sorted = plays_sorted[:limit]
+    if limit is not None and limit >= 0:
+        plays_sorted = heapq.nlargest(limit, plays, key=play_timestamp)
+    else:
+        plays_sorted = sorted(plays, key=play_timestamp, reverse=True)
+        if limit is not None:
+            plays_sorted = plays_sorted[:limit]
 
+    lines: List[str] = []
     for play in plays_sorted:
         date = play.get("date", "Unknown date")
         game = play.get("game", "Game")
@@ -1069,32 +1199,25 @@ def command_plays_list(args: argparse.Namespace) -> int:
         header = f"{date} — {game} ({scored})"
         if event:
             header += f" @ {event}"
-        print(header)
+        lines.append(header)
         for result in play.get("results", []):
             player = result.get("player", "Unknown")
             placement = result.get("placement")
             points = result.get("points", 0)
-            placement_label = (
-                f"{placement}{'st' if placement == 1 else 'nd' if placement == 2 else 'rd'}"
-                if placement in (1, 2, 3)
-                else "Participated"
-            )
+            placement_label = ORDINALS[placement] if placement in (1, 2, 3) else "Participated"
             suffix = f" (+{points} pts)" if points else ""
-            print(f"  {placement_label}: {player}{suffix}")
+            lines.append(f"  {placement_label}: {player}{suffix}")
         if play.get("notes"):
-            print(f"  Notes: {play.get('notes')}")
-        print()
+            lines.append(f"  Notes: {play.get('notes')}")
+        lines.append("")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
     return 0
 
 
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description=__doc__)
-    parser.set_defaults(func=None)
-
-    subparsers = parser.add_subparsers(dest="command")
-
+def _add_award_parser(subparsers: Any, argv: List[str]) -> None:
     award_parser = subparsers.add_parser("award", help="Award points to a player")
     award_parser.add_argument("--player", "-p", help="Player receiving the points")
     award_parser.add_argument("--points", "-P", type=int, help="Points to award")
@@ -1121,34 +1244,55 @@ def build_parser() -> argparse.ArgumentParser:
     award_parser.add_argument("--verbose", "-v", action="store_true", help="Print file updates")
     award_parser.set_defaults(func=command_award)
 
+
+def _add_list_parser(subparsers: Any, argv: List[str]) -> None:
     list_parser = subparsers.add_parser("list", help="Show the current leaderboard")
     list_parser.set_defaults(func=command_list)
 
+
+def _add_events_parser(subparsers: Any, argv: List[str]) -> None:
     events_parser = subparsers.add_parser("events", help="Show the event log with awards")
     events_parser.set_defaults(func=command_events)
 
+
+def _add_rebuild_parser(subparsers: Any, argv: List[str]) -> None:
     rebuild_parser = subparsers.add_parser("rebuild", help="Rebuild leaderboard.json without changes")
     rebuild_parser.set_defaults(func=command_rebuild)
 
-    tokens_parser = subparsers.add_parser("tokens", help="Manage greeting tokens")
-    tokens_subparsers = tokens_parser.add_subparsers(dest="token_command")
 
+def _add_tokens_add_parser(tokens_subparsers: Any, argv: List[str]) -> None:
     tokens_add = tokens_subparsers.add_parser("add", help="Generate unique token(s) for guests")
     tokens_add.add_argument("names", nargs="*", help="Guest names to create tokens for")
     tokens_add.add_argument("--verbose", "-v", action="store_true", help="Print file updates")
     tokens_add.set_defaults(func=command_tokens_add)
 
+
+def _add_tokens_list_parser(tokens_subparsers: Any, argv: List[str]) -> None:
     tokens_list = tokens_subparsers.add_parser("list", help="List existing guest tokens")
     tokens_list.set_defaults(func=command_tokens_list)
 
+
+def _add_tokens_remove_parser(tokens_subparsers: Any, argv: List[str]) -> None:
     tokens_remove = tokens_subparsers.add_parser("remove", help="Delete token(s)")
     tokens_remove.add_argument("tokens", nargs="*", help="Token values to remove")
     tokens_remove.add_argument("--verbose", "-v", action="store_true", help="Print file updates")
     tokens_remove.set_defaults(func=command_tokens_remove)
 
-    plays_parser = subparsers.add_parser("plays", help="Log and review game plays")
-    plays_subparsers = plays_parser.add_subparsers(dest="plays_command")
 
+TOKENS_SUBPARSER_BUILDERS = {
+    "add": _add_tokens_add_parser,
+    "list": _add_tokens_list_parser,
+    "remove": _add_tokens_remove_parser,
+}
+
+
+def _add_tokens_parser(subparsers: Any, argv: List[str]) -> None:
+    tokens_parser = subparsers.add_parser("tokens", help="Manage greeting tokens")
+    tokens_subparsers = tokens_parser.add_subparsers(dest="token_command")
+    _add_selected_parsers(tokens_subparsers, TOKENS_SUBPARSER_BUILDERS, argv)
+
+
+def _add_plays_add_parser(plays_subparsers: Any, argv: List[str]) -> None:
     plays_add = plays_subparsers.add_parser("add", help="Add a play entry")
     plays_add.add_argument("--game", "-g", help="Name of the game played")
     plays_add.add_argument("--date", "-d", help="Date of the play (YYYY-MM-DD)")
@@ -1160,34 +1304,90 @@ def build_parser() -> argparse.ArgumentParser:
     plays_add.add_argument(
         "--players",
         "-p",
-        action="append",
+        action="extend",
+        type=name_list_argument,
         help="Comma-separated list of players who participated",
     )
-    plays_add.add_argument("--first", action="append", help="Comma-separated first place players")
-    plays_add.add_argument("--second", action="append", help="Comma-separated second place players")
-    plays_add.add_argument("--third", action="append", help="Comma-separated third place players")
+    plays_add.add_argument(
+        "--first", action="extend", type=name_list_argument, help="Comma-separated first place players"
+    )
+    plays_add.add_argument(
+        "--second", action="extend", type=name_list_argument, help="Comma-separated second place players"
+    )
+    plays_add.add_argument(
+        "--third", action="extend", type=name_list_argument, help="Comma-separated third place players"
+    )
     plays_add.add_argument("--points-first", type=int, help="Points awarded for first place")
     plays_add.add_argument("--points-second", type=int, help="Points awarded for second place")
     plays_add.add_argument("--points-third", type=int, help="Points awarded for third place")
-    plays_add.add_argument("--award", action="store_true", help="Force auto-awarding points")
-    plays_add.add_argument("--no-award", action="store_true", help="Skip awarding points")
+    plays_add.add_argument(
+        "--award",
+        action=argparse.BooleanOptionalAction,
+        help="Force (or skip with --no-award) auto-awarding points",
+    )
     plays_add.add_argument("--note", "-n", help="Notes about the play")
     plays_add.add_argument("--play-id", help="Custom identifier for the play entry")
     plays_add.add_argument("--verbose", "-v", action="store_true", help="Print file updates")
     plays_add.set_defaults(func=command_plays_add)
 
+
+def _add_plays_list_parser(plays_subparsers: Any, argv: List[str]) -> None:
     plays_list = plays_subparsers.add_parser("list", help="List recorded plays")
     plays_list.add_argument("--limit", type=int, help="Limit the number of plays shown")
     plays_list.set_defaults(func=command_plays_list)
 
+
+PLAYS_SUBPARSER_BUILDERS = {
+    "add": _add_plays_add_parser,
+    "list": _add_plays_list_parser,
+}
+
+
+def _add_plays_parser(subparsers: Any, argv: List[str]) -> None:
+    plays_parser = subparsers.add_parser("plays", help="Log and review game plays")
+    plays_subparsers = plays_parser.add_subparsers(dest="plays_command")
+    _add_selected_parsers(plays_subparsers, PLAYS_SUBPARSER_BUILDERS, argv)
+
+
+SUBPARSER_BUILDERS = {
+    "award": _add_award_parser,
+    "list": _add_list_parser,
+    "events": _add_events_parser,
+    "rebuild": _add_rebuild_parser,
+    "tokens": _add_tokens_parser,
+    "plays": _add_plays_parser,
+}
+
+
+def _add_selected_parsers(subparsers: Any, builders: Dict[str, Any], argv: List[str]) -> None:
+    # a known subcommand only needs its own branch; help, typos and no-args get the full tree
+    command = argv[0] if argv else None
+    if command in builders:
+        # spell out every command so usage lines match the fully built parser
+        subparsers.metavar = "{" + ",".join(builders) + "}"
+        builders[command](subparsers, argv[1:])
+    else:
+        for add_subparser in builders.values():
+            add_subparser(subparsers, [])
+
+
+def build_parser(argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.set_defaults(func=None)
+
+    subparsers = parser.add_subparsers(dest="command")
+    _add_selected_parsers(subparsers, SUBPARSER_BUILDERS, argv or [])
+
     return parser
 
 
 def main(argv: Optional[List[str]] = None) -> int:
-    parser = build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = build_parser(argv)
     args = parser.parse_args(argv)
     if args.func is None:
-        parser.print_help(sys.stderr)
+        build_parser().print_help(sys.stderr)
         return 1
     return args.func(args)
 